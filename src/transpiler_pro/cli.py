@@ -13,46 +13,63 @@ It coordinates:
 4. **Fixing**: Applying NLP-based auto-repairs.
 """
 
-import tomllib
+import functools
+import os
 import subprocess
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import typer
-from rich.console import Console
 
-from transpiler_pro.core.converter import DocConverter
-from transpiler_pro.core.fixer import StyleFixer
-from transpiler_pro.core.linter import StyleLinter
+from transpiler_pro.utils.config import load_project_config
 from transpiler_pro.utils.paths import INPUT_DIR, OUTPUT_DIR
 
 app = typer.Typer(
     name="transpiler-pro",
     help="Enterprise Documentation Pipeline with Autonomous Style Sync.",
-    no_args_is_help=True, 
+    no_args_is_help=True,
     add_completion=False
 )
-console = Console()
+
+
+@functools.cache
+def _console():
+    """Builds the Rich console on first use so `--help`-style invocations skip it."""
+    from rich.console import Console
+    return Console()
 
 DEFAULT_CONFIG = Path("pyproject.toml")
 
+# Batches below this size stay in a single Pandoc invocation; larger ones
+# are sharded across a process pool so subprocess startups and I/O overlap.
+_PARALLEL_MIN_JOBS = 8
+
+
+def _convert_shard(shard, config_path):
+    """
+    Converts one shard of (input, output) jobs in a worker process.
+
+    Only the paths cross the process boundary; each worker rebuilds its
+    own `DocConverter` (compiled patterns and all) from the shared
+    mtime-keyed config cache rather than pickling the instance.
+    """
+    from transpiler_pro.core.converter import DocConverter
+    DocConverter(config_path=config_path).convert_batch(shard)
+
 def load_config(config_path: Path) -> Dict[str, Any]:
     """
     Loads global pipeline settings from a TOML configuration file.
-    
+
+    Delegates to the shared mtime-keyed cache, so the CLI and all three
+    engines parse the same `pyproject.toml` exactly once per file version.
+
     Args:
         config_path: Path to the `pyproject.toml` file.
-        
+
     Returns:
         A dictionary containing the `tool.transpiler-pro` configuration block.
     """
-    if not config_path.exists():
-        return {}
-    try:
-        with open(config_path, "rb") as f:
-            return tomllib.load(f).get("tool", {}).get("transpiler-pro", {})
-    except Exception:
-        return {}
+    return load_project_config(config_path)
 
 def sync_styles() -> None:
     """
@@ -61,7 +78,7 @@ def sync_styles() -> None:
     This ensures that the latest enterprise linguistic standards are applied 
     before the linting phase begins.
     """
-    console.print("\n[bold blue]Pre-flight:[/] Syncing SUSE Style Guide via Git...")
+    _console().print("\n[bold blue]Pre-flight:[/] Syncing SUSE Style Guide via Git...")
     try:
         subprocess.run(
             ["git", "submodule", "update", "--init", "--remote", "styles/suse-styles"],
@@ -69,11 +86,11 @@ def sync_styles() -> None:
             capture_output=True,
             text=True
         )
-        console.print("  [bold green]✓[/] Style guide is synchronized and up-to-date.")
+        _console().print("  [bold green]✓[/] Style guide is synchronized and up-to-date.")
     except subprocess.CalledProcessError as e:
-        console.print(f"  [bold yellow]⚠️ Warning:[/] Sync failed. Using local cached styles. {e.stderr}")
+        _console().print(f"  [bold yellow]⚠️ Warning:[/] Sync failed. Using local cached styles. {e.stderr}")
     except FileNotFoundError:
-        console.print("  [bold red]Error:[/] Git not found in system path. Skipping sync.")
+        _console().print("  [bold red]Error:[/] Git not found in system path. Skipping sync.")
 
 def run_pipeline(
     file_name: Optional[str] = None,
@@ -88,6 +105,12 @@ def run_pipeline(
     This function allows for direct invocation without CLI-specific 
     argument validation, facilitating more robust testing.
     """
+    # Engine imports are deferred so `version` and `--help` skip the heavy
+    # converter/fixer/linter import graph (including spaCy).
+    from transpiler_pro.core.converter import DocConverter
+    from transpiler_pro.core.fixer import StyleFixer
+    from transpiler_pro.core.linter import StyleLinter
+
     # 0. Optional Style Sync
     if sync:
         sync_styles()
@@ -99,52 +122,100 @@ def run_pipeline(
     
     # 2. Target Detection
     if file_name:
-        target_files = [INPUT_DIR / file_name]
+        candidate = INPUT_DIR / file_name
+        target_files = [candidate] if candidate.exists() else []
     else:
-        exts = pipeline_config.get("pipeline", {}).get("supported_extensions", [".md", ".mdx"])
+        exts = frozenset(pipeline_config.get("pipeline", {}).get("supported_extensions", [".md", ".mdx"]))
         if not INPUT_DIR.exists():
-            console.print(f"[bold yellow]Notification:[/] Directory {INPUT_DIR} not found.")
+            _console().print(f"[bold yellow]Notification:[/] Directory {INPUT_DIR} not found.")
             return
-        target_files = [p for p in INPUT_DIR.iterdir() if p.suffix in exts]
+        # os.scandir avoids per-entry Path construction and stat calls for
+        # files that are filtered out anyway.
+        with os.scandir(INPUT_DIR) as entries:
+            target_files = [
+                Path(entry.path) for entry in entries
+                if entry.is_file(follow_symlinks=False)
+                and "." + entry.name.rpartition(".")[2] in exts
+            ]
 
     if not target_files:
-        console.print("[bold yellow]Notification:[/] No source files detected.")
+        _console().print("[bold yellow]Notification:[/] No source files detected.")
         return
 
-    # 3. Pipeline Execution Loop
-    for md_path in target_files:
-        if not md_path.exists(): 
-            continue
-            
-        adoc_path = OUTPUT_DIR / md_path.with_suffix(".adoc").name
-        
-        # Phase 1: Conversion
-        if not lint_only:
-            console.print(f"\n[bold blue]Phase 1:[/] Converting [cyan]{md_path.name}[/]")
+    # 3. Conversion Phase — discovery already proved every entry is a
+    # file (scandir dirents / the explicit-target check above), so no
+    # second stat per path here.
+    jobs = [
+        (md_path, OUTPUT_DIR / md_path.with_suffix(".adoc").name)
+        for md_path in target_files
+    ]
+
+    if not lint_only:
+        if len(jobs) > 1:
+            # Multiple files share a single Pandoc invocation; large
+            # batches are sharded across worker processes instead.
+            names = ", ".join(src.name for src, _ in jobs)
+            _console().print(f"\n[bold blue]Phase 1:[/] Converting batch [cyan]{names}[/]")
+            workers = min(len(jobs), os.cpu_count() or 1)
             try:
-                converter.convert_file(md_path, adoc_path)
+                if len(jobs) >= _PARALLEL_MIN_JOBS and workers > 1:
+                    from concurrent.futures import ProcessPoolExecutor
+                    shards = [jobs[i::workers] for i in range(workers)]
+                    with ProcessPoolExecutor(max_workers=workers) as pool:
+                        futures = [
+                            pool.submit(_convert_shard, shard, config_path)
+                            for shard in shards if shard
+                        ]
+                        for future in futures:
+                            future.result()
+                else:
+                    converter.convert_batch(jobs)
             except Exception as e:
-                console.print(f"  [bold red]Error:[/] {e}")
-                continue
-        
-        # Phase 2 & 3: Linter & Fixer
-        if adoc_path.exists():
-            console.print(f"[bold blue]Phase 2:[/] Validating [cyan]{adoc_path.name}[/]")
-            linter = StyleLinter(adoc_path, config_path=config_path)
-            linter.setup_config()
-            findings = linter.run()
-            linter.display_report(findings)
-
-            if fix and findings:
-                console.print(f"[bold blue]Phase 3:[/] Auto-repairing [cyan]{adoc_path.name}[/]")
-                file_key = str(adoc_path.resolve())
-                file_violations = findings.get(file_key, [])
-                
-                if file_violations:
-                    repaired_count = fixer.fix_file(adoc_path, file_violations)
-                    if repaired_count > 0:
-                        console.print(f"  [bold green]✨ Repaired {repaired_count} violations.[/]")
-                        linter.display_report(linter.run())
+                _console().print(f"  [bold red]Error:[/] {e}")
+        else:
+            for md_path, adoc_path in jobs:
+                _console().print(f"\n[bold blue]Phase 1:[/] Converting [cyan]{md_path.name}[/]")
+                try:
+                    converter.convert_file(md_path, adoc_path)
+                except Exception as e:
+                    _console().print(f"  [bold red]Error:[/] {e}")
+
+    adoc_paths = [adoc_path for _, adoc_path in jobs if adoc_path.exists()]
+
+    if not adoc_paths:
+        return
+
+    # 4. Validation & Repair — one linter session and a single Vale
+    # invocation cover every converted file.
+    linter = StyleLinter(adoc_paths[0], config_path=config_path)
+    linter.setup_config()
+    findings = linter.run(adoc_paths)
+
+    # Repairs are independent per file, so hand the whole batch to
+    # fix_files — it forks workers for multi-file runs and stays
+    # sequential for a single file.
+    fix_results: Dict[Path, Any] = {}
+    if fix and findings:
+        fix_jobs = [
+            (adoc_path, file_violations)
+            for adoc_path in adoc_paths
+            if (file_violations := findings.get(str(adoc_path.resolve())))
+        ]
+        if fix_jobs:
+            fix_results = fixer.fix_files(fix_jobs)
+
+    for adoc_path in adoc_paths:
+        _console().print(f"[bold blue]Phase 2:[/] Validating [cyan]{adoc_path.name}[/]")
+        file_key = str(adoc_path.resolve())
+        file_violations = findings.get(file_key)
+        linter.display_report({file_key: file_violations} if file_violations else {})
+
+        if fix and file_violations:
+            _console().print(f"[bold blue]Phase 3:[/] Auto-repairing [cyan]{adoc_path.name}[/]")
+            repaired_count, remaining = fix_results.get(adoc_path, (0, file_violations))
+            if repaired_count > 0:
+                _console().print(f"  [bold green]✨ Repaired {repaired_count} violations.[/]")
+                linter.display_report({file_key: remaining} if remaining else {})
 
 @app.command(name="run")
 def execute_pipeline(
@@ -165,10 +236,53 @@ def execute_pipeline(
         config_path=Path(config)
     )
 
+@app.command(name="refine")
+def bulk_refine(
+    config: str = typer.Option(str(DEFAULT_CONFIG), "--config", "-c", help="Path to config file")
+) -> None:
+    """
+    Injects the configured Antora headers into every converted AsciiDoc file.
+
+    Already-refined files are detected by peeking at the first few bytes
+    instead of reading the whole file, so repeat runs are near free.
+    """
+    headers = load_config(Path(config)).get("antora", {}).get("headers", [])
+    if not headers:
+        _console().print("[bold yellow]Notification:[/] No Antora headers configured.")
+        return
+    if not OUTPUT_DIR.exists():
+        _console().print(f"[bold yellow]Notification:[/] Directory {OUTPUT_DIR} not found.")
+        return
+
+    prefix = headers[0].encode("utf-8")
+    # Encoded once; every rewrite below reuses the same bytes instead of
+    # re-encoding the block and building a file-sized intermediate string.
+    header_block = ("\n".join(headers) + "\n\n").encode("utf-8")
+    refined = 0
+    # Same scandir recipe as the pipeline's source discovery: cached
+    # DirEntry names, no Path construction for filtered-out files.
+    with os.scandir(OUTPUT_DIR) as entries:
+        adoc_files = [
+            Path(entry.path) for entry in entries
+            if entry.is_file(follow_symlinks=False) and entry.name.endswith(".adoc")
+        ]
+    for adoc_path in adoc_files:
+        with adoc_path.open("rb") as fh:
+            head = fh.read(len(prefix))
+            if head == prefix:
+                continue
+            body = head + fh.read()
+        with adoc_path.open("wb") as fh:
+            fh.write(header_block)
+            fh.write(body)
+        refined += 1
+
+    _console().print(f"[bold green]✓[/] Refined {refined} file(s) with Antora headers.")
+
 @app.command(name="version")
 def version():
     """Display the version of Transpiler-Pro."""
-    console.print("Transpiler-Pro v1.0.0")
+    _console().print("Transpiler-Pro v1.0.0")
 
 def main():
     """Main entry point."""
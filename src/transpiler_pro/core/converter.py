@@ -11,11 +11,75 @@ transformation of Markdown into AsciiDoc using a three-phase pipeline:
 3. **Restoration**: Converting markers back into native AsciiDoc syntax.
 """
 
+import os
 import re
 import subprocess
-import tomllib
 from pathlib import Path
-from typing import Match, Optional, Dict, Any
+from typing import List, Match, Optional, Dict, Any, Tuple
+from uuid import uuid4
+
+from transpiler_pro.utils.config import load_project_config
+
+try:
+    # The third-party `regex` module supports possessive quantifiers and
+    # atomic groups, giving linear-time guarantees on marker bodies.
+    # Patterns opt in via `engine = "regex"` in the TOML; without the
+    # module installed they silently run on stdlib `re`.
+    import regex as _regex_engine
+except ImportError:
+    _regex_engine = None
+
+_FLAG_MAP = {"M": re.M, "S": re.S, "I": re.I}
+
+# Fallback xref pattern when the config does not supply one, and the
+# matcher for leading global inline flags folded into fused branches.
+# Hoisted to module scope so per-instance compilation never re-parses them.
+_DEFAULT_XREF_REGEX = r'link:((?!http)[^ ]*)\.(md|json|yaml|yml)'
+_LEADING_FLAGS_RE = re.compile(r"\(\?([imsx]+)\)")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Writes to a sibling temp file and renames it into place in one syscall."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _split_template(template: str) -> Tuple[str, str, str]:
+    """
+    Splits a \\1/\\2 replacement template into its three literal segments.
+
+    Hooks then rebuild the replacement with a single f-string instead of
+    scanning the template for slot markers on every match; a template
+    containing literal backslash-digit text can no longer be mangled by
+    re-substitution.
+    """
+    head, _, rest = template.partition(r"\1")
+    mid, _, tail = rest.partition(r"\2")
+    return head, mid, tail
+
+
+def _compile_with_engine(pattern: str, flags: int = 0, engine: Optional[str] = None):
+    """Compiles with the `regex` module when a pattern opts in and it is installed."""
+    if engine == "regex" and _regex_engine is not None:
+        return _regex_engine.compile(pattern, flags)
+    return re.compile(pattern, flags)
+
+
+def _pattern_flags(spec: Optional[List[str]], default: int = 0) -> int:
+    """
+    Translates a TOML `flags` list (e.g. ["M", "S"]) into `re` flags.
+
+    Patterns without an explicit list keep the historical default so that
+    existing configurations are unaffected.
+    """
+    if spec is None:
+        return default
+    flags = 0
+    for name in spec:
+        flags |= _FLAG_MAP.get(name, 0)
+    return flags
+
 
 class DocConverter:
     """
@@ -27,135 +91,277 @@ class DocConverter:
         conv_cfg (Dict): Conversion-specific patterns and rules.
     """
 
+    # Space sentinel for collapsible titles: a private-use codepoint swapped
+    # in/out via str.translate (one C-level pass) so titles survive Pandoc
+    # without multi-char substring replacement in the hot hooks.
+    _PROTECT_TBL = str.maketrans({" ": ""})
+    _RESTORE_TBL = str.maketrans({"": " "})
+    # Matches the literal \1 / \2 slots in replacement templates.
+    _SLOT_RE = re.compile(r"\\([12])")
+
     def __init__(self, config_path: Optional[Path] = None):
         """Initializes the converter with settings from the provided config path."""
         self.config_path = config_path or Path("pyproject.toml")
         self.config = self._load_project_config()
         self.conv_cfg = self.config.get("conversions", {})
+        self._compile_patterns()
 
     def _load_project_config(self) -> Dict[str, Any]:
-        """Loads the configuration block from the TOML file."""
-        if not self.config_path.exists():
-            return {}
-        try:
-            with open(self.config_path, "rb") as f:
-                return tomllib.load(f).get("tool", {}).get("transpiler-pro", {})
-        except Exception:
-            return {}
+        """Loads the configuration block via the shared mtime-keyed cache."""
+        return load_project_config(self.config_path)
+
+    def _compile_patterns(self) -> None:
+        """
+        Compiles every configured pattern exactly once.
+
+        Per-file processing then reuses `re.Pattern` objects instead of
+        re-parsing raw TOML strings on each `re.sub` call; mapping-based
+        restoration patterns are pre-expanded per key/value pair.
+        """
+        self._shield_compiled = [
+            (_compile_with_engine(p["regex"], _pattern_flags(p.get("flags"), re.S), p.get("engine")),
+             _split_template(p["replacement"]) if p.get("hook") else p["replacement"],
+             p.get("hook"))
+            for p in self.conv_cfg.get("shielding_patterns", [])
+        ]
+
+        # Cleanup and restoration rules fuse into one alternation so the
+        # post-processing pass scans the content exactly once instead of
+        # once per rule. Each branch is wrapped in a scoped-flags group
+        # carrying its own M/S behavior; mapping-based restorations keep
+        # the single keyed alternation (one scan replaces K per-key scans,
+        # `{key}` must precede the pattern's own capture groups). Because
+        # branch group numbers shift inside the alternation, every handler
+        # records the absolute index of its outer group.
+        specs = []
+        # One engine covers the whole fused pattern: if any rule opts into
+        # `regex`, every branch compiles under it (a compatible superset).
+        fused_engine = None
+        # Cleanup rules also stay compiled on their own: historically they
+        # ran over the whole content *before* restoration, so the
+        # dispatcher re-applies them to each restored region — a marker
+        # body full of `:`-prefixed artifacts is cleaned exactly as it was
+        # when cleanup preceded restoration as a separate pass.
+        self._cleanup_compiled = []
+        for c in self.conv_cfg.get("cleanup_regex", []):
+            scoped = "m" if c.get("flags") == "M" else ""
+            specs.append((c["regex"], scoped, "cleanup", c["replacement"]))
+            fused_engine = fused_engine or c.get("engine")
+            self._cleanup_compiled.append(
+                (_compile_with_engine(c["regex"], _pattern_flags([c.get("flags", "")]),
+                                      c.get("engine")),
+                 c["replacement"])
+            )
+        for r in self.conv_cfg.get("restoration_patterns", []):
+            regex, replacement = r.get("regex"), r.get("replacement")
+            mapping = r.get("map")
+            fused_engine = fused_engine or r.get("engine")
+            if mapping:
+                keys = sorted(mapping, key=len, reverse=True)
+                key_group = f"__k{len(specs)}"
+                keyed = regex.replace(
+                    "{key}", f"(?P<{key_group}>{'|'.join(map(re.escape, keys))})"
+                )
+                specs.append((keyed, "s", "map", (replacement, mapping, key_group)))
+            elif r.get("hook") == "restore_spaces":
+                specs.append((regex, "s", "spaces", _split_template(replacement)))
+            else:
+                specs.append((regex, "s", "template", replacement))
+
+        parts: List[str] = []
+        self._postproc_handlers = []
+        group_total = 0
+        for i, (regex, scoped, kind, payload) in enumerate(specs):
+            # Global inline flags like a leading (?s) are illegal inside an
+            # alternation branch; fold them into the scoped-flags wrapper.
+            leading = _LEADING_FLAGS_RE.match(regex)
+            if leading:
+                scoped = "".join(sorted(set(scoped + leading.group(1))))
+                regex = regex[leading.end():]
+            body = f"(?{scoped}:{regex})" if scoped else regex
+            parts.append(f"(?P<r{i}>{body})")
+            self._postproc_handlers.append((group_total + 1, kind, payload))
+            group_total += 1 + _compile_with_engine(body, 0, fused_engine).groups
+        self._postproc_re = (
+            _compile_with_engine("|".join(parts), 0, fused_engine) if parts else None
+        )
+        # Extension table resolved once; post_process_asciidoc runs per
+        # file and should not re-walk the config dicts for it.
+        self._ext_map = self.conv_cfg.get("extension_map", {})
+        self._has_postproc = bool(parts or self._ext_map)
+
+        # Normalization rules are fused into one alternation so each xref
+        # path is scanned once instead of once per rule. Replacements are
+        # emitted literally, keyed by the matching rule's group name.
+        norm_rules = self.conv_cfg.get("path_normalization", [])
+        if norm_rules:
+            self._norm_re = re.compile(
+                "|".join(f"(?P<n{i}>{rule['regex']})" for i, rule in enumerate(norm_rules))
+            )
+            self._norm_repls = [rule["replacement"] for rule in norm_rules]
+        else:
+            self._norm_re = None
+            self._norm_repls = []
+        self._xref_re = re.compile(
+            self.conv_cfg.get("xref_detection_regex", _DEFAULT_XREF_REGEX)
+        )
 
     def pre_process_markdown(self, content: str) -> str:
         """
         Shields Markdown blocks using patterns defined in configuration.
-        
+
         Args:
             content: Raw Markdown string.
-            
+
         Returns:
             Markdown string with complex blocks replaced by markers.
         """
-        patterns = self.conv_cfg.get("shielding_patterns", [])
-        
-        for p in patterns:
-            regex = p.get("regex")
-            replacement = p.get("replacement")
-            
-            if p.get("hook") == "protect_spaces":
-                def protect_hook(match: Match) -> str:
-                    title = match.group(1).strip().replace(' ', 'PROTECT_SPACE')
+        if not self._shield_compiled:
+            return content
+        for pattern, replacement, hook in self._shield_compiled:
+            if hook == "protect_spaces":
+                def protect_hook(match: Match, _segs: Tuple[str, str, str] = replacement) -> str:
+                    title = match.group(1).strip().translate(self._PROTECT_TBL)
                     body = match.group(2).strip()
-                    return replacement.replace(r"\1", title).replace(r"\2", body)
-                content = re.sub(regex, protect_hook, content, flags=re.S)
+                    return f"{_segs[0]}{title}{_segs[1]}{body}{_segs[2]}"
+                content = pattern.sub(protect_hook, content)
             else:
-                content = re.sub(regex, replacement, content, flags=re.S)
-        
+                content = pattern.sub(replacement, content)
+
         return content
 
+    def _postproc_dispatch(self, match: Match) -> str:
+        """
+        Resolves the replacement for one fused post-processing match.
+
+        Template slots (\\1, \\2) are rebased onto the matched branch's
+        absolute group indices; mapping branches additionally skip their
+        leading key group. Restored regions are re-run through the cleanup
+        rules, which used to see marker bodies before restoration consumed
+        them.
+        """
+        for outer, kind, payload in self._postproc_handlers:
+            if match.group(outer) is None:
+                continue
+            if kind == "cleanup":
+                return self._SLOT_RE.sub(
+                    lambda m: match.group(outer + int(m.group(1))) or "", payload
+                )
+            if kind == "map":
+                replacement, mapping, key_group = payload
+                expanded = replacement.replace("{val}", mapping[match.group(key_group)])
+                expanded = self._SLOT_RE.sub(
+                    lambda m: match.group(outer + 1 + int(m.group(1))) or "", expanded
+                )
+            elif kind == "spaces":
+                title = match.group(outer + 1).translate(self._RESTORE_TBL).strip()
+                body = match.group(outer + 2).strip()
+                expanded = f"{payload[0]}{title}{payload[1]}{body}{payload[2]}"
+            else:
+                expanded = self._SLOT_RE.sub(
+                    lambda m: match.group(outer + int(m.group(1))) or "", payload
+                )
+            for cleanup_re, cleanup_repl in self._cleanup_compiled:
+                expanded = cleanup_re.sub(cleanup_repl, expanded)
+            return expanded
+        return match.group(0)
+
     def post_process_asciidoc(self, content: str) -> str:
         """
         Restores markers and cleans artifacts based on strict TOML rules.
-        
+
         Args:
             content: Raw AsciiDoc produced by the transpiler.
-            
+
         Returns:
             Finalized AsciiDoc with native syntax restored.
         """
-        # 1. Generic Cleanup (e.g., removing frontmatter artifacts)
-        cleanup = self.conv_cfg.get("cleanup_regex", [])
-        for c in cleanup:
-            flags = re.M if c.get("flags") == "M" else 0
-            content = re.sub(c["regex"], c["replacement"], content, flags=flags)
-
-        # 2. Dynamic Marker Restoration
-        restorations = self.conv_cfg.get("restoration_patterns", [])
-        for r in restorations:
-            regex = r.get("regex")
-            replacement = r.get("replacement")
-            
-            if r.get("hook") == "restore_spaces":
-                def restore_hook(match: Match) -> str:
-                    title = match.group(1).replace('PROTECT_SPACE', ' ').strip()
-                    body = match.group(2).strip()
-                    return replacement.replace(r"\1", title).replace(r"\2", body)
-                content = re.sub(regex, restore_hook, content, flags=re.S)
-            else:
-                mapping = r.get("map")
-                if mapping:
-                    for key, val in mapping.items():
-                        current_regex = regex.replace("{key}", key)
-                        current_replace = replacement.replace("{val}", val)
-                        content = re.sub(current_regex, current_replace, content, flags=re.S)
-                else:
-                    content = re.sub(regex, replacement, content, flags=re.S)
+        # Minimal configs (no patterns, no extension map) skip straight out.
+        if not self._has_postproc:
+            return content.strip()
+
+        # 1. Fused Cleanup + Marker Restoration — a single scan over the
+        # content; the dispatcher picks the handler for whichever branch
+        # of the alternation matched.
+        if self._postproc_re is not None:
+            content = self._postproc_re.sub(self._postproc_dispatch, content)
 
         # 3. Dynamic XREFs and Extension Mapping
-        ext_map = self.conv_cfg.get("extension_map", {})
+        ext_map = self._ext_map
         if ext_map:
-            normalization = self.conv_cfg.get("path_normalization", [])
-            
             def clean_xref(match: Match) -> str:
                 path, ext = match.group(1), match.group(2)
-                for rule in normalization:
-                    path = re.sub(rule["regex"], rule["replacement"], path)
-                
+                if self._norm_re is not None:
+                    path = self._norm_re.sub(
+                        lambda m: self._norm_repls[int(m.lastgroup[1:])], path
+                    )
+
                 new_ext = ext_map.get(ext, ext)
                 return f'xref:{path}.{new_ext}'
-            
-            xref_pattern = self.conv_cfg.get("xref_detection_regex", r'link:((?!http)[^ ]*)\.(md|json|yaml|yml)')
-            content = re.sub(xref_pattern, clean_xref, content)
+
+            content = self._xref_re.sub(clean_xref, content)
 
         return content.strip()
 
+    def convert_batch(self, jobs: List[Tuple[Path, Path]]) -> None:
+        """
+        Converts several Markdown files through a single Pandoc invocation.
+
+        The shielded inputs are joined with a unique sentinel, piped through
+        one Pandoc process, and the output is split back apart — eliminating
+        N-1 subprocess startups for an N-file batch.
+
+        Args:
+            jobs: List of (input_path, output_path) pairs.
+        """
+        if not jobs:
+            return
+
+        sentinel = f"ZZZSPLIT{uuid4().hex}ZZZ"
+        shielded = [
+            self.pre_process_markdown(src.read_bytes().decode("utf-8", "replace"))
+            for src, _ in jobs
+        ]
+        combined = f"\n\n{sentinel}\n\n".join(shielded)
+
+        result = subprocess.run(
+            ["pandoc", "-f", "markdown", "-t", "asciidoc", "--wrap=none"],
+            input=combined,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        chunks = re.split(rf"\n*{sentinel}\n*", result.stdout)
+        if len(chunks) != len(jobs):
+            # A mangled separator would silently misassign content to
+            # files under zip truncation — refuse instead.
+            raise RuntimeError(
+                f"Batch conversion produced {len(chunks)} chunks for {len(jobs)} files; "
+                "Pandoc altered a batch separator."
+            )
+        for (_, output_path), chunk in zip(jobs, chunks):
+            _atomic_write(output_path, self.post_process_asciidoc(chunk).encode("utf-8"))
+
     def convert_file(self, input_path: Path, output_path: Path) -> None:
         """
         Orchestrates the conversion of a single file.
-        
-        Uses Pandoc for the base conversion from Markdown to AsciiDoc.
+
+        The shielded Markdown is piped to Pandoc on stdin and the AsciiDoc
+        captured from stdout, so no temp file or intermediate output write
+        is needed. Source bytes are decoded exactly once; the output is
+        written in binary, skipping the text layer's newline translation.
         """
-        raw_md = input_path.read_text(encoding='utf-8')
+        raw_md = input_path.read_bytes().decode("utf-8", "replace")
         ready_md = self.pre_process_markdown(raw_md)
-        
-        temp_md = input_path.with_suffix('.tmp.md')
-        temp_md.write_text(ready_md)
-        
-        try:
-            # PANDOC INTEGRATION: Replaces kramdoc
-            # --ascii is used to ensure high compatibility with Antora/AsciiDoc
-            subprocess.run(
-                [
-                    "pandoc", 
-                    "-f", "markdown", 
-                    "-t", "asciidoc", 
-                    "--wrap=none", 
-                    "-o", str(output_path), 
-                    str(temp_md)
-                ], 
-                check=True, 
-                capture_output=True
-            )
-            
-            final_adoc = self.post_process_asciidoc(output_path.read_text())
-            output_path.write_text(final_adoc)
-        finally:
-            if temp_md.exists(): 
-                temp_md.unlink()
\ No newline at end of file
+
+        # PANDOC INTEGRATION: Replaces kramdoc
+        result = subprocess.run(
+            ["pandoc", "-f", "markdown", "-t", "asciidoc", "--wrap=none"],
+            input=ready_md,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        _atomic_write(output_path, self.post_process_asciidoc(result.stdout).encode("utf-8"))
\ No newline at end of file
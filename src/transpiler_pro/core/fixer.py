@@ -11,16 +11,122 @@ It utilizes:
 3. **Global Enforcement**: A safety-pass to ensure consistency across all documentation.
 """
 
+import atexit
+import functools
+import itertools
+import os
 import re
 import json
-import tomllib
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 import spacy
-from rich.console import Console
 
-console = Console()
+from transpiler_pro.utils.config import load_project_config
+from transpiler_pro.utils.console import console
+
+try:
+    # orjson serializes several times faster than stdlib json; the
+    # knowledge base falls back to json.dumps without it.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # google-re2 matches large alternations in linear time regardless of
+    # branch count — worthwhile once the branding table grows past a few
+    # dozen entries. Stdlib re remains the fallback.
+    import re2
+except ImportError:
+    re2 = None
+
+
+@functools.lru_cache(maxsize=2)
+def _load_spacy(model: str = "en_core_web_sm", exclude: Tuple[str, ...] = ("ner",)):
+    """
+    Loads the spaCy model once per process and shares it across fixers.
+
+    Unpickling the model costs hundreds of milliseconds and ~50 MB; repeat
+    `StyleFixer` constructions (per-file runs, tests) reuse the cached
+    instance. Returns None when the model is unavailable.
+    """
+    try:
+        # Tense shifting only reads POS, dependency, morph and lemma
+        # data; excluding NER skips loading its weights entirely.
+        return spacy.load(model, exclude=list(exclude))
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _word_re(word: str) -> re.Pattern:
+    """
+    Returns the \\b-anchored, case-insensitive pattern for a word.
+
+    Compiled exactly once per distinct word — the repair loops would
+    otherwise re-build identical patterns per violation per line, easily
+    blowing the re module's internal cache on a large knowledge base.
+    """
+    return re.compile(rf"\b{re.escape(word)}\b", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _removal_re(words: Tuple[str, ...]) -> re.Pattern:
+    """
+    Like `_word_re` but fuses every removal target on a line into one
+    alternation (longest first) and consumes one trailing space for clean
+    removal — a single scan instead of one sub per flagged word.
+    """
+    alt = "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+    return re.compile(rf"\b(?:{alt})\b\s?", re.IGNORECASE)
+
+
+# Terms quoted in linter messages, straight or typographic quotes alike.
+_QUOTED_RE = re.compile(r"['‘]([^'’‘]+)['’]")
+
+_VOWELS = frozenset("aeiou")
+
+# Pronouns that force plural agreement when morphology is inconclusive;
+# frozenset membership beats a per-subject list scan in the tense loop.
+_PLURAL_SUBJECTS = frozenset(("we", "they", "you"))
+
+
+@functools.lru_cache(maxsize=8192)
+def _prog(lemma: str) -> str:
+    """
+    Algorithmic progressive form of a lemma, memoized per distinct verb.
+
+    Documents repeat the same handful of verbs, so the suffix checks and
+    the consonant-vowel-consonant doubling test run once per verb per
+    process.
+    """
+    if lemma.endswith("e") and not lemma.endswith("ee"):
+        return lemma[:-1] + "ing"
+    if (
+        len(lemma) > 2
+        and lemma[-1] not in _VOWELS
+        and lemma[-2] in _VOWELS
+        and lemma[-3] not in _VOWELS
+    ):
+        return lemma + lemma[-1] + "ing"
+    return lemma + "ing"
+
+
+def _fix_job(
+    config_path: Optional[Path], file_path: Path, violations: List[Dict[str, Any]]
+) -> Tuple[Path, int, List[Dict[str, Any]], Dict[str, str]]:
+    """
+    Repairs one file inside a worker process.
+
+    Forked children inherit the parent's cached spaCy model and parsed
+    config via copy-on-write, so constructing a fixer here is cheap; the
+    worker ships its learned terms back for the parent to merge.
+    """
+    fixer = StyleFixer(config_path=config_path)
+    # Persistence stays with the parent: its single merged save replaces
+    # N workers racing over the same knowledge-base temp file.
+    fixer._persist = False
+    fixes, remaining = fixer.fix_file(file_path, violations)
+    return file_path, fixes, remaining, fixer.kb.get("learned", {})
 
 class StyleFixer:
     """
@@ -42,21 +148,39 @@ class StyleFixer:
         kb_setting = self.config.get("pipeline", {}).get("knowledge_base", "data/knowledge_base.json")
         self.kb_path = Path(kb_setting)
         self.kb = self._load_kb()
+        self._compile_branding()
+        self._kb_dirty = False
+        # Worker fixers flip this off so only the parent's single merged
+        # save touches the knowledge-base file — N workers racing
+        # os.replace on the same temp path lose files.
+        self._persist = True
+        atexit.register(self._save_kb)
 
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except Exception:
-            self.nlp = None
+        # Message-classification patterns compiled once per fixer; fix_file
+        # previously rebuilt the extraction regex on every call.
+        patterns = self.config.get("patterns", {})
+        self._extract_pat = re.compile(patterns.get("suggestion_extraction", r"'(.*?)'"))
+        self._remove_trigger = patterns.get("removal_trigger", "removing")
+        self._instead_trigger = patterns.get("instead_of_trigger", "instead of")
+
+        # Verb-override table resolved once; the conjugation helper runs
+        # per flagged verb and should not re-walk the config dicts.
+        self._special_verbs = self.config.get("grammar", {}).get("special_verbs", {})
+
+    @property
+    def nlp(self):
+        """
+        The shared spaCy model, loaded lazily on first linguistic use.
+
+        Construction stays model-free, so fixers built for purely
+        mechanical repairs (or just to read the knowledge base) never pay
+        the ~1s load; repeat access hits `_load_spacy`'s process cache.
+        """
+        return _load_spacy()
 
     def _load_config(self) -> Dict[str, Any]:
-        """Loads configuration from the project's TOML file."""
-        if not self.config_path.exists(): 
-            return {}
-        try:
-            with open(self.config_path, "rb") as f:
-                return tomllib.load(f).get("tool", {}).get("transpiler-pro", {})
-        except (tomllib.TOMLDecodeError, OSError):
-            return {}
+        """Loads configuration via the shared mtime-keyed cache."""
+        return load_project_config(self.config_path)
 
     def _load_kb(self) -> Dict[str, Any]:
         """Loads the external JSON brain for persistent learning."""
@@ -67,11 +191,60 @@ class StyleFixer:
                 pass
         return {"branding": {}, "learned": {}}
 
+    def _compile_branding(self) -> None:
+        """
+        Builds the single branding alternation used by global enforcement.
+
+        One longest-first alternation scan per line replaces a search+sub
+        pair per branding entry; `None` when the knowledge base is empty.
+        """
+        branding = self.kb.get("branding", {})
+        if branding:
+            keys = sorted(branding, key=len, reverse=True)
+            union_src = r"\b(?:" + "|".join(map(re.escape, keys)) + r")\b"
+            self._brand_union = None
+            if re2 is not None:
+                try:
+                    self._brand_union = re2.compile("(?i)" + union_src)
+                except re2.error:
+                    pass
+            if self._brand_union is None:
+                self._brand_union = re.compile(union_src, re.IGNORECASE)
+            self._brand_map = {k.lower(): v for k, v in branding.items()}
+        else:
+            self._brand_union = None
+            self._brand_map = {}
+
+        # Merged learned+branding table for Phase A, keyed lowercase so
+        # quoted terms from messages resolve directly. Built once here and
+        # kept current as new words are learned, instead of being remerged
+        # on every fix_file call.
+        self._session_map = {
+            k.lower(): v
+            for k, v in {**self.kb.get("learned", {}), **branding}.items()
+        }
+
     def _save_kb(self) -> None:
-        """Persists discovered and learned words back to the JSON file."""
+        """
+        Persists discovered and learned words back to the JSON file.
+
+        No-op unless the knowledge base actually changed since the last
+        save; the write goes to a temp file and is renamed into place so a
+        crash can never truncate the brain. Registered with atexit as a
+        final flush.
+        """
+        if not self._kb_dirty or not self._persist:
+            return
         try:
             self.kb_path.parent.mkdir(parents=True, exist_ok=True)
-            self.kb_path.write_text(json.dumps(self.kb, indent=4), encoding="utf-8")
+            if orjson is not None:
+                payload = orjson.dumps(self.kb, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self.kb, indent=4).encode("utf-8")
+            tmp = self.kb_path.with_name(self.kb_path.name + ".tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, self.kb_path)
+            self._kb_dirty = False
         except Exception as e:
             console.print(f"[red]Error saving Knowledge Base:[/] {e}")
 
@@ -83,121 +256,230 @@ class StyleFixer:
         pyproject.toml to ensure precision over algorithmic guessing.
         """
         lemma = verb_token.lemma_.lower()
-        grammar_cfg = self.config.get("grammar", {})
-        special = grammar_cfg.get("special_verbs", {})
-        
+        special = self._special_verbs
+
         if lemma in special:
             return special[lemma]
 
-        # Algorithmic fallbacks
-        if lemma.endswith("e") and not lemma.endswith("ee"):
-            return lemma[:-1] + "ing"
-        if len(lemma) > 2 and lemma[-1] not in "aeiou" and lemma[-2] in "aeiou" and lemma[-3] not in "aeiou":
-            return lemma + lemma[-1] + "ing"
-        return lemma + "ing"
+        # Algorithmic fallback — memoized, since configs can't affect it
+        return _prog(lemma)
 
-    def _fix_tense(self, line: str) -> str:
+    def _fix_tense(self, line: str, doc=None) -> str:
         """
         Shifts sentence tense from future ('will') to progressive present.
-        
+
         Example: "We will test" -> "We are testing".
+
+        Accepts an already-parsed `doc` so batch callers can feed lines
+        through `nlp.pipe` instead of paying per-call model overhead.
         """
-        if not self.nlp: 
+        if not self.nlp:
             return line
-        doc = self.nlp(line)
+        if doc is None:
+            # Cheap guard: no "will", no parse needed.
+            low = line.lower()
+            if " will " not in low and not low.startswith("will "):
+                return line
+            doc = self.nlp(line)
         working_line = line
         for token in doc:
             if token.text.lower() == "will":
                 main_verb = token.head
                 if main_verb.pos_ == "VERB":
                     subjects = [w for w in main_verb.lefts if "subj" in w.dep_]
-                    is_plural = any("Number=Plur" in str(s.morph) or s.text.lower() in ["we", "they", "you"] for s in subjects)
+                    is_plural = any("Number=Plur" in str(s.morph) or s.text.lower() in _PLURAL_SUBJECTS for s in subjects)
                     aux = "are" if is_plural else "is"
                     prog = self._get_progressive_verb(main_verb)
                     working_line = re.sub(rf"\b{token.text}\s+{main_verb.text}\b", f"{aux} {prog}", working_line, flags=re.IGNORECASE)
         return working_line
 
-    def fix_file(self, file_path: Path, violations: List[Dict[str, Any]]) -> int:
+    def fix_files(
+        self,
+        jobs: List[Tuple[Path, List[Dict[str, Any]]]],
+        workers: Optional[int] = None,
+    ) -> Dict[Path, Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Repairs several files across forked worker processes.
+
+        Fork-based workers inherit the already-loaded spaCy model through
+        copy-on-write pages instead of re-loading ~50 MB each; platforms
+        without fork (or single-job calls) fall back to sequential repair.
+        Learned terms discovered in workers are merged back into the
+        parent's knowledge base and persisted once.
+
+        Args:
+            jobs: List of (file_path, violations) pairs.
+            workers: Worker-process cap; defaults to the CPU count.
+
+        Returns:
+            Mapping of file path to that file's (fixes, remaining) result.
+        """
+        import multiprocessing
+
+        results: Dict[Path, Tuple[int, List[Dict[str, Any]]]] = {}
+        if not jobs:
+            return results
+
+        workers = min(len(jobs), workers or os.cpu_count() or 1)
+        if workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+            from concurrent.futures import ProcessPoolExecutor
+
+            ctx = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+                futures = [
+                    pool.submit(_fix_job, self.config_path, path, violations)
+                    for path, violations in jobs
+                ]
+                for future in futures:
+                    path, fixes, remaining, learned = future.result()
+                    results[path] = (fixes, remaining)
+                    for word, correct in learned.items():
+                        if word not in self.kb["learned"]:
+                            self.kb["learned"][word] = correct
+                            self._session_map[word] = correct
+                            self._kb_dirty = True
+            self._save_kb()
+        else:
+            for path, violations in jobs:
+                results[path] = self.fix_file(path, violations)
+        return results
+
+    def _prepare_violations(
+        self, violations: List[Dict[str, Any]], extract_pat: re.Pattern, max_line: int
+    ) -> List[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Groups violations by line, descending, with per-issue fields
+        computed once.
+
+        Out-of-range lines are dropped here so the repair loop needs no
+        bounds check, and a single sort plus `itertools.groupby` replaces
+        dict accumulation. The repair loop revisits each issue's message
+        several times (quoted terms, lowercase triggers, extraction
+        targets); deriving them here keeps that work off the hot path.
+        """
+        valid = [v for v in violations if 0 < v.get("Line", 0) <= max_line]
+        valid.sort(key=lambda v: -v["Line"])
+
+        def prepare(v: Dict[str, Any]) -> Dict[str, Any]:
+            msg = v.get("Message", "")
+            return {
+                "check": v.get("Check", ""),
+                "msg_lower": msg.lower(),
+                "quoted": _QUOTED_RE.findall(msg),
+                "targets": extract_pat.findall(msg),
+            }
+
+        return [
+            (line_num, [prepare(v) for v in group])
+            for line_num, group in itertools.groupby(valid, key=lambda v: v["Line"])
+        ]
+
+    def fix_file(self, file_path: Path, violations: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
         """
         Orchestrates surgical repairs and global enforcement on a single file.
-        
+
         Args:
             file_path: Path to the AsciiDoc output.
             violations: List of issues identified by the StyleLinter.
-            
+
         Returns:
-            int: Total number of lines modified.
+            A (lines_modified, remaining_violations) tuple, where the second
+            element holds the issues on lines the fixer did not change —
+            saving callers a second linter pass over the repaired file.
         """
-        if not file_path.exists(): 
-            return 0
+        if not file_path.exists():
+            return 0, violations
         content = file_path.read_text(encoding="utf-8").splitlines()
         total_fixes = 0
-        
-        line_map = defaultdict(list)
-        for v in violations: 
-            line_map[v.get("Line", 0)].append(v)
+        repaired_lines = set()
 
-        patterns = self.config.get("patterns", {})
-        extract_re = patterns.get("suggestion_extraction", r"'(.*?)'")
-        remove_trigger = patterns.get("removal_trigger", "removing")
+        remove_trigger = self._remove_trigger
+        instead_trigger = self._instead_trigger
+
+        line_groups = self._prepare_violations(violations, self._extract_pat, len(content))
+
+        session_branding = self._session_map
 
-        # Combine branding and learned words for high-priority matching
-        session_branding = {**self.kb.get("learned", {}), **self.kb.get("branding", {})}
+        # Parse every tense-flagged line in one spaCy batch up front; the
+        # per-line loop then reuses the parsed docs instead of invoking the
+        # model once per line.
+        tense_docs: Dict[int, Any] = {}
+        if self.nlp is not None:
+            tense_idxs = [
+                line_num - 1
+                for line_num, issues in line_groups
+                if any(i["check"] == "common.Will" for i in issues)
+            ]
+            if tense_idxs:
+                docs = self.nlp.pipe((content[i] for i in tense_idxs), batch_size=64)
+                tense_docs = dict(zip(tense_idxs, docs))
 
-        for line_num in sorted(line_map.keys(), reverse=True):
+        for line_num, issues in line_groups:
             idx = line_num - 1
-            if idx < 0 or idx >= len(content): 
-                continue
-            
+
             working_line = content[idx]
             original_line = working_line
 
             # --- PHASE A: LINTER-DRIVEN REPAIRS ---
-            for issue in line_map[line_num]:
-                msg = issue.get("Message", "")
-                check_id = issue.get("Check", "")
-
-                # 1. Branding Sync
-                for wrong, correct in session_branding.items():
-                    if f"'{wrong}'" in msg.lower() or f"‘{wrong}’" in msg.lower():
-                        working_line = re.sub(rf"\b{re.escape(wrong)}\b", correct, working_line, flags=re.IGNORECASE)
-
-                # 2. Surgical Removal
-                if remove_trigger in msg.lower():
-                    targets = re.findall(extract_re, msg)
+            removal_words: List[str] = []
+            for issue in issues:
+                msg_lower = issue["msg_lower"]
+                check_id = issue["check"]
+                targets = issue["targets"]
+
+                # 1. Branding Sync — look up the terms the message actually
+                # quotes instead of scanning the whole knowledge base.
+                for quoted in issue["quoted"]:
+                    correct = session_branding.get(quoted.lower())
+                    if correct is not None:
+                        working_line = _word_re(quoted.lower()).sub(correct, working_line)
+
+                # 2. Surgical Removal — collected and fused into a single
+                # alternation sub once the line's issues are classified.
+                if remove_trigger in msg_lower:
                     if targets:
-                        working_line = re.sub(rf"\b{re.escape(targets[0])}\b\s?", "", working_line, flags=re.IGNORECASE)
+                        removal_words.append(targets[0])
 
                 # 3. Phrasal Substitution
-                elif "instead of" in msg.lower():
-                    terms = re.findall(extract_re, msg)
-                    if len(terms) >= 2:
-                        working_line = re.sub(rf"\b{re.escape(terms[1])}\b", terms[0], working_line, flags=re.IGNORECASE)
+                elif instead_trigger in msg_lower:
+                    if len(targets) >= 2:
+                        working_line = _word_re(targets[1]).sub(targets[0], working_line)
 
                 # 4. Spelling + Learning Discovery
                 elif "Spelling" in check_id:
-                    targets = re.findall(extract_re, msg)
                     if targets:
                         word = targets[0]
                         if word.lower() not in session_branding:
                             capitalized = word.capitalize()
-                            working_line = re.sub(rf"\b{re.escape(word)}\b", capitalized, working_line, flags=re.IGNORECASE)
+                            working_line = _word_re(word).sub(capitalized, working_line)
                             if word.lower() not in self.kb["branding"]:
                                 self.kb["learned"][word.lower()] = capitalized
+                                self._session_map[word.lower()] = capitalized
+                                self._kb_dirty = True
 
                 # 5. Tense Shift
                 if check_id == "common.Will":
-                    working_line = self._fix_tense(working_line)
+                    working_line = self._fix_tense(working_line, tense_docs.get(idx))
+
+            if removal_words:
+                working_line = _removal_re(tuple(removal_words)).sub("", working_line)
 
             # --- PHASE B: GLOBAL ENFORCEMENT PASS ---
-            for wrong, correct in self.kb.get("branding", {}).items():
-                if re.search(rf"\b{re.escape(wrong)}\b", working_line, flags=re.IGNORECASE):
-                    working_line = re.sub(rf"\b{re.escape(wrong)}\b", correct, working_line)
+            if self._brand_union is not None:
+                working_line = self._brand_union.sub(
+                    lambda m: self._brand_map[m.group(0).lower()], working_line
+                )
 
             if working_line != original_line:
                 content[idx] = working_line
                 total_fixes += 1
+                repaired_lines.add(line_num)
+
+        # Reassemble and write only when a line actually changed; untouched
+        # files skip the join, the encode and the disk write entirely.
+        if total_fixes:
+            file_path.write_text("\n".join(content), encoding="utf-8")
+        self._save_kb()
 
-        file_path.write_text("\n".join(content), encoding="utf-8")
-        self._save_kb() 
-        return total_fixes
\ No newline at end of file
+        remaining = [v for v in violations if v.get("Line", 0) not in repaired_lines]
+        return total_fixes, remaining
\ No newline at end of file
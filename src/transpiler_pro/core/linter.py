@@ -8,20 +8,80 @@ checks using the Vale CLI. It dynamically generates configuration on-the-fly
 based on settings defined in `pyproject.toml`.
 """
 
+import functools
 import json
+import os
 import re
 import subprocess
-import textwrap
-import tomllib
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from rich.console import Console
 from rich.table import Table
 
-from transpiler_pro.utils.paths import STYLES_DIR
+try:
+    # ijson parses Vale's JSON report incrementally off the pipe, so huge
+    # reports never sit in memory twice (stdout buffer + parsed tree).
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # google-re2 matches in linear time with no backtracking — immune to
+    # pathological Vale descriptions. Stdlib re remains the fallback.
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    # Fast whole-buffer JSON parse for the non-streaming path.
+    import orjson
+except ImportError:
+    orjson = None
+
+from transpiler_pro.utils.config import load_project_config
+from transpiler_pro.utils.console import console
+from transpiler_pro.utils.paths import STYLES_DIR_RESOLVED
+
+# Fallback severity colors when the TOML config defines no theme; a module
+# constant instead of a fresh literal per display_report call.
+_DEFAULT_THEME = {
+    "error": "red",
+    "warning": "yellow",
+    "suggestion": "blue",
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_pattern(pattern: str):
+    """
+    Compiles config-supplied patterns once per process instead of per issue.
+
+    Prefers re2's DFA engine when installed; patterns it cannot express
+    (backreferences, lookarounds) fall back to stdlib re.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_cached(search_pool: str, suggestion_re) -> str:
+    """
+    Regex-extraction core, memoized on the message text.
+
+    Canonical Vale messages ("Use 'SUSE' instead of 'suse'") recur
+    thousands of times across a corpus; repeats skip the regex entirely.
+    """
+    if suggestion_re is not None and search_pool.strip():
+        match = suggestion_re.search(search_pool)
+        if match:
+            return match.group(1)
+
+    return ""
 
-console = Console()
 
 class StyleLinter:
     """
@@ -36,6 +96,8 @@ class StyleLinter:
     def __init__(self, target_path: Path, config_path: Optional[Path] = None):
         """Initializes the linter with path isolation for configuration."""
         self.target_path = target_path
+        # Resolved once; run() reuses it instead of re-walking the path.
+        self._abs_target = str(target_path.resolve())
         self.config_path = config_path or Path("pyproject.toml")
         
         # Isolation: .vale.ini generated in context of current config
@@ -44,15 +106,20 @@ class StyleLinter:
         self.config = self._load_project_config()
         self.guide_url = self.config.get("meta", {}).get("guide_url", "")
 
+        # A warmed-up Vale server skips per-run process spawn and rule
+        # compilation; opt in by exporting VALE_SERVER_URL.
+        self.server_url = os.environ.get("VALE_SERVER_URL", "").rstrip("/")
+
+        # Compiled once per linter; _extract_suggestion runs per issue and
+        # should not pay even the regex-cache lookup on each call.
+        patterns_cfg = self.config.get("patterns", {})
+        pattern = patterns_cfg.get("suggestion_extraction")
+        self._suggestion_re = _compile_pattern(pattern) if pattern else None
+        self._ignored = frozenset(patterns_cfg.get("ignored_placeholders", []))
+
     def _load_project_config(self) -> Dict[str, Any]:
-        """Loads linter-specific metadata from the dynamic config path."""
-        if not self.config_path.exists():
-            return {}
-        try:
-            with open(self.config_path, "rb") as f:
-                return tomllib.load(f).get("tool", {}).get("transpiler-pro", {})
-        except Exception:
-            return {}
+        """Loads linter-specific metadata via the shared mtime-keyed cache."""
+        return load_project_config(self.config_path)
 
     def setup_config(self) -> None:
         """
@@ -62,83 +129,163 @@ class StyleLinter:
         without hardcoded paths.
         """
         linter_cfg = self.config.get("linter", {})
-        styles_root = str(STYLES_DIR.resolve()).replace("\\", "/")
-        
+        styles_root = STYLES_DIR_RESOLVED
+
         styles = linter_cfg.get("styles", [])
         styles_str = ", ".join(styles) if styles else "Vale"
         min_level = linter_cfg.get("min_alert_level", "suggestion")
 
-        config_raw = f"""
-        StylesPath = {styles_root}
-        MinAlertLevel = {min_level}
+        # Pre-dedented template: interpolating into flush-left lines skips
+        # the per-call textwrap.dedent line scan.
+        config_raw = (
+            f"StylesPath = {styles_root}\n"
+            f"MinAlertLevel = {min_level}\n"
+            "\n"
+            "[*.{adoc,md}]\n"
+            f"BasedOnStyles = {styles_str}"
+        )
 
-        [*.{{adoc,md}}]
-        BasedOnStyles = {styles_str}
-        """
-        
-        self.vale_ini.write_text(textwrap.dedent(config_raw).strip())
+        # Encode once and stay in byte mode: write_bytes skips the
+        # TextIOWrapper layer and sidesteps newline translation.
+        config_bytes = config_raw.encode("utf-8")
+
+        # Rewriting an identical config would cost a syscall and invalidate
+        # Vale's own mtime-based caching for nothing.
+        try:
+            if self.vale_ini.read_bytes() == config_bytes:
+                return
+        except OSError:
+            pass
+        self.vale_ini.write_bytes(config_bytes)
 
     def _extract_suggestion(self, issue: Dict[str, Any]) -> str:
         """Extracts a repair suggestion from a Vale issue using TOML-defined patterns."""
-        action_params = issue.get("Action", {}).get("Params", [])
-        patterns_cfg = self.config.get("patterns", {})
-        ignored = patterns_cfg.get("ignored_placeholders", [])
-        
-        if action_params:
-            candidate = str(action_params[0])
-            if candidate not in ignored:
+        # Fast path: most rules supply Action.Params, so the regex (and
+        # even the search-pool concatenation) never runs for them.
+        params = issue.get("Action", {}).get("Params")
+        if params:
+            candidate = str(params[0])
+            if candidate not in self._ignored:
                 return candidate
 
         search_pool = issue.get("Description", "") + " " + issue.get("Message", "")
-        pattern = patterns_cfg.get("suggestion_extraction")
-        
-        if pattern and search_pool.strip():
-            match = re.search(pattern, search_pool)
-            if match:
-                return match.group(1)
-        
-        return ""
+        return _extract_cached(search_pool, self._suggestion_re)
 
-    def run(self) -> Dict[str, List[Dict[str, Any]]]:
+    def _lint_via_server(self, paths: List[Path]) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Executes the Vale CLI and processes findings into a standardized format.
-        
-        Returns:
-            A dictionary where keys are file paths and values are lists of issues.
+        Lints file contents through a running Vale server's HTTP API.
+
+        The server keeps its styles compiled between requests, cutting the
+        per-run cost from process spawn plus rule compilation to a local
+        round-trip per file.
         """
-        try:
-            abs_target = str(self.target_path.resolve())
-            
-            result = subprocess.run(
-                ["vale", "--config", str(self.vale_ini.resolve()), "--output=JSON", abs_target],
-                capture_output=True,
-                text=True,
-                check=False
+        import urllib.parse
+        import urllib.request
+
+        findings: Dict[str, List[Dict[str, Any]]] = {}
+        for path in paths:
+            payload = urllib.parse.urlencode({
+                "text": path.read_text(encoding="utf-8"),
+                "format": path.suffix or ".adoc",
+            }).encode("utf-8")
+            request = urllib.request.Request(f"{self.server_url}/vale", data=payload)
+            with urllib.request.urlopen(request, timeout=30) as response:
+                data = json.loads(response.read().decode("utf-8"))
+            key = str(path.resolve())
+            for issues in data.values():
+                findings.setdefault(key, []).extend(issues)
+        return findings
+
+    def _lint_via_cli(self, cmd: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Runs the Vale CLI, streaming the report through ijson when available."""
+        if ijson is not None:
+            # Stream the report: issues are parsed per file while Vale
+            # is still writing, overlapping its I/O with our reshaping.
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
             )
-            
-            if not result.stdout or result.stdout.strip() == "":
-                return {}
-
-            raw_data = json.loads(result.stdout)
-            processed_findings = {}
-
-            for file_path, file_issues in raw_data.items():
-                processed_findings[file_path] = []
-                for issue in file_issues:
-                    processed_findings[file_path].append({
-                        "Line": issue.get("Line"),
-                        "Check": issue.get("Check"),
-                        "Severity": issue.get("Severity"),
-                        "Message": issue.get("Message"),
-                        "Description": issue.get("Description", ""),
-                        "Suggestion": self._extract_suggestion(issue)
-                    })
-                
-            return processed_findings
+            raw_data = {}
+            try:
+                for file_path, file_issues in ijson.kvitems(proc.stdout, ""):
+                    raw_data[file_path] = file_issues
+            except Exception:
+                raw_data = {}
+            finally:
+                proc.stdout.close()
+                proc.wait()
+            return raw_data
 
-        except (FileNotFoundError, json.JSONDecodeError, subprocess.SubprocessError):
+        # No text=True: both json.loads and orjson.loads accept bytes, so
+        # decoding the whole report into a second str buffer is wasted work.
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            check=False
+        )
+
+        if not result.stdout or not result.stdout.strip():
             return {}
 
+        if orjson is not None:
+            # Whole-buffer parse in native code — the next best thing when
+            # the streaming path above is unavailable.
+            return orjson.loads(result.stdout)
+        return json.loads(result.stdout)
+
+    def iter_findings(
+        self, targets: Optional[Iterable[Path]] = None
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Executes the Vale CLI and yields `(file_path, issues)` pairs.
+
+        Suggestion extraction happens per file as pairs are consumed, so a
+        caller fixing files one at a time starts on the first file before
+        the rest of the report is annotated.
+        """
+        try:
+            if targets is None:
+                paths = [self.target_path]
+                abs_targets = [self._abs_target]
+            else:
+                paths = list(targets)
+                abs_targets = [str(p.resolve()) for p in paths]
+
+            raw_data = None
+            if self.server_url:
+                try:
+                    raw_data = self._lint_via_server(paths)
+                except Exception:
+                    # Server unreachable or misbehaving — use the CLI.
+                    raw_data = None
+
+            if raw_data is None:
+                cmd = ["vale", "--config", str(self.vale_ini.resolve()), "--output=JSON", *abs_targets]
+                raw_data = self._lint_via_cli(cmd)
+        except (FileNotFoundError, json.JSONDecodeError, subprocess.SubprocessError):
+            return
+
+        for file_path, file_issues in raw_data.items():
+            # Annotate Vale's own issue dicts in place instead of copying
+            # six fields into fresh dicts per issue — halves allocations
+            # on large reports.
+            for issue in file_issues:
+                issue.setdefault("Description", "")
+                issue["Suggestion"] = self._extract_suggestion(issue)
+            yield file_path, file_issues
+
+    def run(self, targets: Optional[Iterable[Path]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Executes the Vale CLI and processes findings into a standardized format.
+
+        Args:
+            targets: Optional iterable of files to lint in a single Vale
+                invocation; defaults to the linter's own target path.
+
+        Returns:
+            A dictionary where keys are file paths and values are lists of issues.
+        """
+        return dict(self.iter_findings(targets))
+
     def display_report(self, data: Dict[str, List[Dict[str, Any]]]) -> None:
         """Renders a visual Rich table of violations found in the documentation."""
         if not data or not any(data.values()):
@@ -146,11 +293,14 @@ class StyleLinter:
             return
 
         linter_cfg = self.config.get("linter", {})
-        theme = linter_cfg.get("theme", {
-            "error": "red", 
-            "warning": "yellow", 
-            "suggestion": "blue"
-        })
+        theme = linter_cfg.get("theme", _DEFAULT_THEME)
+
+        # One markup string per severity, built up front — the per-row
+        # f-string format and theme lookup disappear from the hot loop.
+        severity_tags = {
+            sev: f"[{theme.get(sev, 'white')}]{sev}[/]"
+            for sev in ("error", "warning", "suggestion", *theme)
+        }
 
         table = Table(title="Style Guide Validation Report", title_style="bold cyan")
         table.add_column("Line", style="magenta", justify="right")
@@ -161,11 +311,10 @@ class StyleLinter:
         for _, issues in data.items():
             for issue in issues:
                 sev = issue['Severity']
-                color = theme.get(sev, "white")
-                
+
                 table.add_row(
                     str(issue['Line']),
-                    f"[{color}]{sev}[/]",
+                    severity_tags.get(sev) or f"[{theme.get(sev, 'white')}]{sev}[/]",
                     issue['Message'],
                     issue['Check']
                 )
@@ -0,0 +1,54 @@
+"""
+Location: src/transpiler_pro/utils/config.py
+
+Description: Shared Configuration Cache for Transpiler-Pro.
+
+All engines (Converter, Linter, Fixer) read the same `tool.transpiler-pro`
+block from `pyproject.toml`. This module parses it once per file version —
+the cache is keyed by resolved path and mtime, so an edited file is
+re-parsed automatically while repeat constructions hit the cache.
+"""
+
+import functools
+from pathlib import Path
+from typing import Any, Dict
+
+try:
+    # rtoml's Rust parser is noticeably faster than tomllib on large
+    # pyproject files; fall back to the stdlib when it is not installed.
+    import rtoml
+
+    def _parse_toml(path_str: str) -> Dict[str, Any]:
+        with open(path_str, "r", encoding="utf-8") as f:
+            return rtoml.load(f)
+except ImportError:
+    import tomllib
+
+    def _parse_toml(path_str: str) -> Dict[str, Any]:
+        with open(path_str, "rb") as f:
+            return tomllib.load(f)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parses the TOML file; exactly one parse per (path, mtime) pair."""
+    return _parse_toml(path_str).get("tool", {}).get("transpiler-pro", {})
+
+
+def load_project_config(config_path: Path) -> Dict[str, Any]:
+    """
+    Returns the `tool.transpiler-pro` configuration block for a TOML file.
+
+    Args:
+        config_path: Path to the `pyproject.toml` file.
+
+    Returns:
+        The parsed configuration dictionary, or an empty dict when the file
+        is missing or unreadable.
+    """
+    if not config_path.exists():
+        return {}
+    try:
+        return _load_cached(str(config_path.resolve()), config_path.stat().st_mtime_ns)
+    except Exception:
+        return {}
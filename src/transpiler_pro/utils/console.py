@@ -0,0 +1,13 @@
+"""
+Location: src/transpiler_pro/utils/console.py
+
+Description: Shared Rich Console for Transpiler-Pro.
+
+Constructing a `Console` probes the terminal (isatty, color depth, width)
+synchronously; doing that once here and importing the instance keeps every
+engine on the same probe and the same output stream.
+"""
+
+from rich.console import Console
+
+console = Console()
@@ -26,6 +26,10 @@ OUTPUT_DIR: Path = DATA_DIR / "outputs"
 # STYLES_DIR: Points to the localized SUSE style definitions and Vale rulesets.
 STYLES_DIR: Path = BASE_DIR / "styles" / "suse-styles"
 
+# Resolved once at import; per-call .resolve() walks every path component
+# through realpath(3), which adds up across batch linter runs.
+STYLES_DIR_RESOLVED: str = str(STYLES_DIR.resolve()).replace("\\", "/")
+
 
 def initialize_directories() -> None:
     """
@@ -42,9 +46,12 @@ def initialize_directories() -> None:
     ]
 
     for directory in required_dirs:
-        # 'parents=True' handles nested creation; 
-        # 'exist_ok=True' prevents errors if already present.
-        directory.mkdir(parents=True, exist_ok=True)
+        # is_dir() is a single stat; skipping mkdir in the common
+        # already-created case keeps repeat imports syscall-light.
+        if not directory.is_dir():
+            # 'parents=True' handles nested creation;
+            # 'exist_ok=True' prevents errors if already present.
+            directory.mkdir(parents=True, exist_ok=True)
 
 
 # Immediate execution ensures the filesystem is ready for the engines.
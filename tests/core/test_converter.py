@@ -38,26 +38,63 @@ def test_restoration_logic(converter):
     assert "====" in result
 
 def test_pandoc_call_construction(converter, monkeypatch, tmp_path):
-    """Verifies that convert_file constructs the correct Pandoc command."""
+    """Verifies that convert_file pipes content through the correct Pandoc command."""
     import subprocess
-    called_cmds = []
-    
+    calls = []
+
     def mock_run(cmd, **kwargs):
-        called_cmds.append(cmd)
-        # Find the output file path in the pandoc command (-o <path>)
-        out_idx = cmd.index("-o") + 1
-        Path(cmd[out_idx]).write_text("Mock Output")
-        return subprocess.CompletedProcess(cmd, 0)
+        calls.append((cmd, kwargs))
+        return subprocess.CompletedProcess(cmd, 0, stdout="Mock Output")
 
     monkeypatch.setattr("subprocess.run", mock_run)
-    
+
     in_file = tmp_path / "input.md"
     in_file.write_text("# Test")
     out_file = tmp_path / "output.adoc"
-    
+
     converter.convert_file(in_file, out_file)
-    
-    # Assert Pandoc was the chosen engine
-    assert called_cmds[0][0] == "pandoc"
-    assert "-f" in called_cmds[0]
-    assert "markdown" in called_cmds[0]
\ No newline at end of file
+
+    # Assert Pandoc was the chosen engine, fed via stdin (no temp file / -o)
+    cmd, kwargs = calls[0]
+    assert cmd[0] == "pandoc"
+    assert "-f" in cmd
+    assert "markdown" in cmd
+    assert kwargs["input"] == "# Test"
+    assert out_file.read_text() == "Mock Output"
+
+def test_convert_batch_splits_per_file(converter, monkeypatch, tmp_path):
+    """Verifies that a batch run writes each file its own post-processed chunk."""
+    import subprocess
+
+    def mock_run(cmd, **kwargs):
+        # Echo the combined input back, as an ideal Pandoc would.
+        return subprocess.CompletedProcess(cmd, 0, stdout=kwargs["input"])
+
+    monkeypatch.setattr("subprocess.run", mock_run)
+
+    jobs = []
+    for name in ("one", "two"):
+        src = tmp_path / f"{name}.md"
+        src.write_text(f"content {name}")
+        jobs.append((src, tmp_path / f"{name}.adoc"))
+
+    converter.convert_batch(jobs)
+
+    assert (tmp_path / "one.adoc").read_text() == "content one"
+    assert (tmp_path / "two.adoc").read_text() == "content two"
+
+def test_convert_batch_rejects_chunk_mismatch(converter, monkeypatch, tmp_path):
+    """Verifies that a mangled batch separator fails loudly instead of misassigning."""
+    import subprocess
+
+    monkeypatch.setattr("subprocess.run", lambda cmd, **kwargs:
+                        subprocess.CompletedProcess(cmd, 0, stdout="single blob"))
+
+    jobs = []
+    for name in ("one", "two"):
+        src = tmp_path / f"{name}.md"
+        src.write_text(f"content {name}")
+        jobs.append((src, tmp_path / f"{name}.adoc"))
+
+    with pytest.raises(RuntimeError, match="separator"):
+        converter.convert_batch(jobs)
\ No newline at end of file
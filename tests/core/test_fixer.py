@@ -100,4 +100,38 @@ def test_surgical_removal(mock_fixer, tmp_path):
     }]
     
     mock_fixer.fix_file(test_file, violations)
-    assert "This is important." in test_file.read_text()
\ No newline at end of file
+    assert "This is important." in test_file.read_text()
+
+def test_fix_files_batch(mock_fixer, tmp_path):
+    """Verifies the multi-file entry point repairs each file and merges learning."""
+    file_a = tmp_path / "a.adoc"
+    file_a.write_text("Check the suse docs.")
+    file_b = tmp_path / "b.adoc"
+    file_b.write_text("This is very important.")
+
+    jobs = [
+        (file_a, [{"Line": 1, "Message": "Use 'SUSE' instead of 'suse'", "Check": "SUSE.Branding"}]),
+        (file_b, [{"Line": 1, "Message": "Consider removing 'very'", "Check": "SUSE.Very"}]),
+    ]
+
+    results = mock_fixer.fix_files(jobs, workers=1)
+
+    assert results[file_a][0] == 1
+    assert results[file_b][0] == 1
+    assert "SUSE" in file_a.read_text()
+    assert "This is important." in file_b.read_text()
+
+def test_worker_fixer_does_not_persist(mock_fixer, tmp_path):
+    """Ensures worker-mode fixers leave knowledge-base writes to the parent."""
+    test_file = tmp_path / "w.adoc"
+    test_file.write_text("Spelling of kramdoc.")
+
+    mock_fixer._persist = False
+    before = mock_fixer.kb_path.read_text()
+    mock_fixer.fix_file(test_file, [
+        {"Line": 1, "Message": "Spelling error: 'kramdoc'", "Check": "Vale.Spelling"}
+    ])
+
+    # The term is learned in memory but the JSON brain is untouched.
+    assert mock_fixer.kb["learned"]["kramdoc"] == "Kramdoc"
+    assert mock_fixer.kb_path.read_text() == before
\ No newline at end of file
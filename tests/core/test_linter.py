@@ -65,12 +65,52 @@ def test_run_with_mocked_vale(mock_linter, monkeypatch):
         ]
     })
     
-    monkeypatch.setattr("subprocess.run", lambda *args, **kwargs: 
+    # Pin the buffered fallback path so the test stays deterministic
+    # whether or not the optional ijson dependency is installed.
+    monkeypatch.setattr("transpiler_pro.core.linter.ijson", None)
+    monkeypatch.setattr("subprocess.run", lambda *args, **kwargs:
                         subprocess.CompletedProcess(args, 0, stdout=mock_output))
-    
+
     findings = mock_linter.run()
-    
+
     assert len(findings) == 1
     key = list(findings.keys())[0]
     assert findings[key][0]["Line"] == 5
-    assert findings[key][0]["Suggestion"] == "ID"
\ No newline at end of file
+    assert findings[key][0]["Suggestion"] == "ID"
+
+def test_run_with_streaming_parser(mock_linter, monkeypatch):
+    """Verifies the ijson streaming branch consumes the Vale pipe per file."""
+    import io
+    import types
+
+    mock_output = json.dumps({
+        str(mock_linter.target_path.resolve()): [
+            {
+                "Line": 7,
+                "Check": "SUSE.Branding",
+                "Severity": "warning",
+                "Message": "Use 'SUSE' instead of 'suse'"
+            }
+        ]
+    }).encode("utf-8")
+
+    class FakeProc:
+        def __init__(self, *args, **kwargs):
+            self.stdout = io.BytesIO(mock_output)
+        def wait(self):
+            return 0
+
+    # Stand-in ijson with the same kvitems contract: yield top-level
+    # (key, value) pairs straight off the stream.
+    fake_ijson = types.SimpleNamespace(
+        kvitems=lambda stream, prefix: iter(json.load(stream).items())
+    )
+    monkeypatch.setattr("transpiler_pro.core.linter.ijson", fake_ijson)
+    monkeypatch.setattr("subprocess.Popen", FakeProc)
+
+    findings = mock_linter.run()
+
+    assert len(findings) == 1
+    key = list(findings.keys())[0]
+    assert findings[key][0]["Line"] == 7
+    assert findings[key][0]["Suggestion"] == "SUSE"
\ No newline at end of file
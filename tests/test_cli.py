@@ -61,12 +61,72 @@ def test_logic_full_orchestration(logic_setup, monkeypatch, capsys):
     # Mock engines
     monkeypatch.setattr("transpiler_pro.core.converter.DocConverter.convert_file", 
                         lambda self, src, dest: dest.write_text("= Hello"))
-    monkeypatch.setattr("transpiler_pro.core.linter.StyleLinter.run", lambda self: {})
+    monkeypatch.setattr("transpiler_pro.core.linter.StyleLinter.run", lambda self, targets=None: {})
     monkeypatch.setattr("transpiler_pro.core.linter.StyleLinter.setup_config", lambda self: None)
     monkeypatch.setattr("transpiler_pro.core.linter.StyleLinter.display_report", lambda self, x: None)
     
     run_pipeline(file_name="test.md", config_path=logic_setup["tmp"] / "fake.toml")
-    
+
     assert (logic_setup["out"] / "test.adoc").exists()
     captured = capsys.readouterr().out
-    assert "Phase 1" in captured
\ No newline at end of file
+    assert "Phase 1" in captured
+
+def test_logic_batch_orchestration(logic_setup, monkeypatch, capsys):
+    """Tests the multi-file flow: batch conversion, shared linter session, batch repair."""
+    for name in ("a", "b"):
+        (logic_setup["in"] / f"{name}.md").write_text(f"# {name}")
+
+    def mock_batch(self, jobs):
+        for _, dest in jobs:
+            dest.write_text("= Converted")
+    monkeypatch.setattr("transpiler_pro.core.converter.DocConverter.convert_batch", mock_batch)
+
+    def mock_run(self, targets=None):
+        return {
+            str(p.resolve()): [{"Line": 1, "Message": "Use 'SUSE' instead of 'suse'",
+                                "Check": "SUSE.Branding", "Severity": "error"}]
+            for p in targets
+        }
+    monkeypatch.setattr("transpiler_pro.core.linter.StyleLinter.run", mock_run)
+    monkeypatch.setattr("transpiler_pro.core.linter.StyleLinter.setup_config", lambda self: None)
+    monkeypatch.setattr("transpiler_pro.core.linter.StyleLinter.display_report", lambda self, x: None)
+
+    fixed_paths = []
+    def mock_fix_files(self, jobs, workers=None):
+        fixed_paths.extend(path for path, _ in jobs)
+        return {path: (1, []) for path, _ in jobs}
+    monkeypatch.setattr("transpiler_pro.core.fixer.StyleFixer.fix_files", mock_fix_files)
+
+    run_pipeline(fix=True, config_path=logic_setup["tmp"] / "fake.toml")
+
+    captured = capsys.readouterr().out
+    assert "Converting batch" in captured
+    assert (logic_setup["out"] / "a.adoc").exists()
+    assert (logic_setup["out"] / "b.adoc").exists()
+    # Both files went through the batch repair dispatch and reported.
+    assert len(fixed_paths) == 2
+    assert captured.count("Repaired 1 violations") == 2
+
+def test_refine_injects_headers(logic_setup, capsys):
+    """Tests that refine prepends Antora headers and is idempotent."""
+    from transpiler_pro.cli import bulk_refine
+
+    doc = logic_setup["out"] / "doc.adoc"
+    doc.write_text("= Title\n\nBody.")
+    empty = logic_setup["out"] / "empty.adoc"
+    empty.write_text("")
+    short = logic_setup["out"] / "short.adoc"
+    short.write_text(":t")  # shorter than the header prefix
+
+    bulk_refine(config=str(logic_setup["tmp"] / "fake.toml"))
+
+    assert doc.read_text() == ":toc:\n\n= Title\n\nBody."
+    assert empty.read_text() == ":toc:\n\n"
+    assert short.read_text() == ":toc:\n\n:t"
+    assert "Refined 3 file(s)" in capsys.readouterr().out
+
+    # Second run detects the header prefix and rewrites nothing.
+    bulk_refine(config=str(logic_setup["tmp"] / "fake.toml"))
+
+    assert doc.read_text() == ":toc:\n\n= Title\n\nBody."
+    assert "Refined 0 file(s)" in capsys.readouterr().out
\ No newline at end of file